@@ -7,9 +7,10 @@ from .engines.base import (
     SearchResult
 )
 from .engines.whoosh_engine import WhooshBenchmarkEngine
+from .cache import QueryCache
 from .loaders.file_loader import FileQueryLoader
 from .metrics.evaluator import MetricsEvaluator, MetricResult
-from .runner import BenchmarkRunner
+from .runner import BenchmarkRunner, format_summary
 
 __all__ = [
     'BenchmarkEngine',
@@ -17,8 +18,10 @@ __all__ = [
     'BenchmarkResult',
     'SearchResult',
     'WhooshBenchmarkEngine',
+    'QueryCache',
     'FileQueryLoader',
     'MetricsEvaluator',
     'MetricResult',
-    'BenchmarkRunner'
+    'BenchmarkRunner',
+    'format_summary'
 ] 
\ No newline at end of file
@@ -0,0 +1,94 @@
+"""SQLite-backed cache of benchmark search hits."""
+
+import json
+import sqlite3
+import threading
+from collections import OrderedDict
+from pathlib import Path
+from typing import List, Optional, Tuple
+
+from whoosh.index import Index
+
+CachedHit = Tuple[str, str, float]
+# Hits of a query and the time its original search took, in seconds
+CachedSearch = Tuple[List[CachedHit], float]
+
+class QueryCache:
+    """
+    Persistent cache of search hits keyed on (index signature, query, limit),
+    stored with the measured time of the search that produced them
+
+    Lookups go through a bounded in-process LRU first and fall back to the
+    SQLite table, so repeated benchmark runs over an unchanged index skip
+    Whoosh entirely.
+    """
+
+    def __init__(self,
+                 path: str = "./evaluation/cache/benchmark_cache.sqlite",
+                 memory_size: int = 4096):
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self.memory_size = memory_size
+
+        self._memory: "OrderedDict[Tuple[str, str, int], CachedSearch]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(str(self.path), check_same_thread=False)
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS query_cache ("
+            "index_sig TEXT, query TEXT, result_limit INTEGER, payload TEXT, "
+            "PRIMARY KEY (index_sig, query, result_limit))"
+        )
+        self._conn.commit()
+
+    @staticmethod
+    def index_signature(index: Index) -> str:
+        """
+        Identify an index state, changes on every commit or rebuild
+        """
+        folder = getattr(index.storage, 'folder', repr(index.storage))
+        return f"{folder}:{index.indexname}:{index.latest_generation()}:{index.last_modified()}"
+
+    def get(self, index_sig: str, query: str, limit: int) -> Optional[CachedSearch]:
+        key = (index_sig, query, limit)
+        with self._lock:
+            if key in self._memory:
+                self._memory.move_to_end(key)
+                return self._memory[key]
+
+            row = self._conn.execute(
+                "SELECT payload FROM query_cache "
+                "WHERE index_sig = ? AND query = ? AND result_limit = ?",
+                key
+            ).fetchone()
+            if row is None:
+                return None
+
+            payload = json.loads(row[0])
+            # Rows written before search times were stored hold a bare hit list
+            if not isinstance(payload, dict):
+                return None
+            entry = ([tuple(hit) for hit in payload["hits"]], payload["search_time"])
+            self._remember(key, entry)
+            return entry
+
+    def put(self, index_sig: str, query: str, limit: int,
+            hits: List[CachedHit], search_time: float) -> None:
+        key = (index_sig, query, limit)
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO query_cache VALUES (?, ?, ?, ?)",
+                (*key, json.dumps({"hits": hits, "search_time": search_time}))
+            )
+            self._conn.commit()
+            self._remember(key, (hits, search_time))
+
+    def close(self) -> None:
+        with self._lock:
+            self._memory.clear()
+            self._conn.close()
+
+    def _remember(self, key: Tuple[str, str, int], entry: CachedSearch) -> None:
+        self._memory[key] = entry
+        self._memory.move_to_end(key)
+        if len(self._memory) > self.memory_size:
+            self._memory.popitem(last=False)
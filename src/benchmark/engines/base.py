@@ -1,9 +1,10 @@
 from abc import ABC, abstractmethod
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from typing import List, Dict, Any, Optional
 from datetime import datetime
+from ...compat import DATACLASS_SLOTS
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class BenchmarkQuery:
     natural_language: str
     structured_query: str
@@ -12,7 +13,7 @@ class BenchmarkQuery:
     expected_relevant_docs: int = 0
     metadata: Optional[Dict[str, Any]] = None
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class SearchResult:
     """
     A single search result with its relevance metrics
@@ -25,12 +26,14 @@ class SearchResult:
     relevance: float = 0.0
     execution_time: float = 0.0
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class BenchmarkResult:
     query: BenchmarkQuery
     results: List[SearchResult]
     total_time: float
-    timestamp: datetime = datetime.now()
+    timestamp: datetime = field(default_factory=datetime.now)
+    scores: List[float] = field(default_factory=list)
+    relevances: List[float] = field(default_factory=list)
 
 class BenchmarkEngine(ABC):
     """
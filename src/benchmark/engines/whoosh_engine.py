@@ -1,20 +1,49 @@
+import os
 import time
-from typing import List, Optional
+import atexit
+import threading
+from functools import lru_cache
+from typing import Dict, List, Optional, Tuple
 from whoosh.index import Index
 from whoosh.searching import Searcher
 from whoosh.qparser import QueryParser, MultifieldParser, OrGroup
 from whoosh.qparser.plugins import FuzzyTermPlugin
 
 from .base import BenchmarkEngine, BenchmarkQuery, BenchmarkResult, SearchResult
+from ..cache import CachedSearch, QueryCache
+
+# Idle searchers kept per index, beyond this they are closed on cleanup
+_MAX_IDLE_SEARCHERS = os.cpu_count() or 1
+
+_POSITION_FACTORS: List[float] = [1.0 / (1.0 + 0.1 * pos) for pos in range(1, 1025)]
+
+def _position_factors(n: int) -> List[float]:
+    """
+    Rank damping factors 1 / (1 + 0.1 * pos), grown on demand to cover n positions
+    """
+    global _POSITION_FACTORS
+    if n > len(_POSITION_FACTORS):
+        _POSITION_FACTORS = [1.0 / (1.0 + 0.1 * pos) for pos in range(1, 2 * n + 1)]
+    return _POSITION_FACTORS
 
 class WhooshBenchmarkEngine(BenchmarkEngine):
     """
     Benchmark engine for Whoosh search engine
     """
     
-    def __init__(self, index: Index, limit: int = 20):
+    # Idle searchers shared by all engines, keyed by index folder and name,
+    # along with the index signature they were opened on
+    _SEARCHER_POOL: Dict[Tuple[str, str], Tuple[str, List[Searcher]]] = {}
+    _POOL_LOCK = threading.Lock()
+    
+    def __init__(self, index: Index, limit: int = 20, cache: Optional[QueryCache] = None):
         self.index = index
-        self.searcher: Optional[Searcher] = None
+        self.cache = cache
+        self._index_sig = QueryCache.index_signature(index)
+        self._index_key = (getattr(index.storage, 'folder', repr(index.storage)), index.indexname)
+        self._local = threading.local()
+        self._searchers: List[Searcher] = []
+        self._searchers_lock = threading.Lock()
         
         schema = self.index.schema
         fields = ["title", "content", "abstract"] if all(f in schema for f in ["title", "content", "abstract"]) else list(schema.names())
@@ -22,6 +51,7 @@ class WhooshBenchmarkEngine(BenchmarkEngine):
         self.parser = MultifieldParser(fields, schema, group=OrGroup)
         
         self.parser.add_plugin(FuzzyTermPlugin())
+        self._parse = lru_cache(maxsize=1024)(self.parser.parse)
         
         self.field_boosts = {
             "title": 2.0,
@@ -31,57 +61,116 @@ class WhooshBenchmarkEngine(BenchmarkEngine):
         
         self.limit = limit
     
+    @property
+    def searcher(self) -> Optional[Searcher]:
+        """
+        Searcher owned by the calling thread (Whoosh searchers are not reentrant)
+        """
+        return getattr(self._local, 'searcher', None)
+    
     def prepare(self) -> None:
         if self.searcher is None:
-            self.searcher = self.index.searcher()
+            searcher = self._checkout_searcher()
+            self._local.searcher = searcher
+            with self._searchers_lock:
+                self._searchers.append(searcher)
+    
+    def _checkout_searcher(self) -> Searcher:
+        """
+        Reuse an idle pooled searcher over the same index state, or open a new one
+        """
+        with WhooshBenchmarkEngine._POOL_LOCK:
+            index_sig, idle = WhooshBenchmarkEngine._SEARCHER_POOL.get(self._index_key, (None, []))
+            if index_sig == self._index_sig and idle:
+                return idle.pop()
+        return self.index.searcher()
+    
+    @classmethod
+    def close_pooled_searchers(cls) -> None:
+        """
+        Close every idle searcher kept in the shared pool
+        """
+        with cls._POOL_LOCK:
+            pools, cls._SEARCHER_POOL = cls._SEARCHER_POOL, {}
+        for _, searchers in pools.values():
+            for searcher in searchers:
+                searcher.close()
     
     def run_query(self, query: BenchmarkQuery) -> BenchmarkResult:
         """
-        Run a single benchmark query
+        Run a single benchmark query, parsing it only on a cache miss
         """
         if self.searcher is None:
             self.prepare()
         
-        whoosh_query = self.parser.parse(query.structured_query)
-        start_time = time.time()
+        cached = self._cached_search(query.structured_query)
         
-        results = self.searcher.search(
-            whoosh_query, 
-            limit=self.limit,
-            terms=True
-        )
+        if cached is None:
+            whoosh_query = self._parse(query.structured_query)
+            start_time = time.time()
+            
+            results = self.searcher.search(
+                whoosh_query, 
+                limit=self.limit,
+                terms=True
+            )
+            
+            end_time = time.time()
+            elapsed = end_time - start_time
+            
+            stored_fields = self.searcher.stored_fields
+            result_ids, titles, scores = [], [], []
+            for docnum, score in results.items():
+                stored = stored_fields(docnum)
+                result_ids.append(stored.get('id', ''))
+                titles.append(stored.get('title', ''))
+                scores.append(score)
+            if self.cache is not None:
+                hits = list(zip(result_ids, titles, scores))
+                self.cache.put(self._index_sig, query.structured_query, self.limit, hits, elapsed)
+        else:
+            # Report the time of the search that produced the hits, not the cache lookup
+            hits, elapsed = cached
+            result_ids, titles, scores = map(list, zip(*hits)) if hits else ([], [], [])
         
-        end_time = time.time()
+        inv_max_score = 1.0 / max(max(scores, default=1.0), 1e-12)
+        half_expected = max(1, query.expected_relevant_docs) // 2
         
         search_results = []
-        max_score = max((hit.score for hit in results), default=1.0)
-        
-        expected_relevant = max(1, query.expected_relevant_docs)
-        
-        for pos, hit in enumerate(results, 1):
-            normalized_score = hit.score / max_score
-            
-            position_factor = 1.0 / (1.0 + 0.1 * pos)
-            
-            adjusted_score = normalized_score * position_factor
-            relevance = 1.0 if (adjusted_score > 0.2 or pos <= expected_relevant // 2) else 0.0
+        relevances = []
+        columns = zip(result_ids, titles, scores, _position_factors(len(scores)))
+        for pos, (result_id, title, score, position_factor) in enumerate(columns, 1):
+            adjusted_score = score * inv_max_score * position_factor
+            relevance = 1.0 if (adjusted_score > 0.2 or pos <= half_expected) else 0.0
+            relevances.append(relevance)
             
             search_results.append(SearchResult(
                 query=query.structured_query,
-                result_id=hit.get('id', ''),
-                score=hit.score,
+                result_id=result_id,
+                score=score,
                 position=pos,
-                title=hit.get('title', ''),
+                title=title,
                 relevance=relevance,
-                execution_time=end_time - start_time
+                execution_time=elapsed
             ))
         
         return BenchmarkResult(
             query=query,
             results=search_results,
-            total_time=end_time - start_time
+            total_time=elapsed,
+            scores=scores,
+            relevances=relevances
         )
     
+    def _cached_search(self, structured_query: str) -> Optional[CachedSearch]:
+        """
+        Look up previously stored hits and their search time for this index
+        state, if caching is enabled
+        """
+        if self.cache is None:
+            return None
+        return self.cache.get(self._index_sig, structured_query, self.limit)
+    
     def run_benchmark(self, queries: List[BenchmarkQuery]) -> List[BenchmarkResult]:
         """
         Run the complete benchmark suite
@@ -91,8 +180,28 @@ class WhooshBenchmarkEngine(BenchmarkEngine):
     
     def cleanup(self) -> None:
         """
-        Clean up resources
+        Release this engine's searchers back to the shared pool, closing those
+        over an outdated index state and any beyond the pool's size
         """
-        if self.searcher is not None:
-            self.searcher.close()
-            self.searcher = None 
\ No newline at end of file
+        with self._searchers_lock:
+            searchers, self._searchers = self._searchers, []
+        
+        current_sig = QueryCache.index_signature(self.index)
+        to_close: List[Searcher] = []
+        with WhooshBenchmarkEngine._POOL_LOCK:
+            index_sig, idle = WhooshBenchmarkEngine._SEARCHER_POOL.get(self._index_key, (current_sig, []))
+            if index_sig != current_sig:
+                to_close.extend(idle)
+                idle = []
+            if self._index_sig == current_sig:
+                room = max(0, _MAX_IDLE_SEARCHERS - len(idle))
+                idle.extend(searchers[:room])
+                searchers = searchers[room:]
+            to_close.extend(searchers)
+            WhooshBenchmarkEngine._SEARCHER_POOL[self._index_key] = (current_sig, idle)
+        
+        for searcher in to_close:
+            searcher.close()
+        self._local = threading.local()
+
+atexit.register(WhooshBenchmarkEngine.close_pooled_searchers)
\ No newline at end of file
@@ -2,9 +2,15 @@
 
 import re
 from pathlib import Path
-from typing import List, TextIO, Dict, Optional
+from typing import List, TextIO, Dict, Optional, Tuple
 from ..engines.base import BenchmarkQuery
 
+_QUERY_RE = re.compile(r'^query\s+([^#]+?)\s*(?:#.*)?$', re.IGNORECASE)
+_ENTRY_RE = re.compile(r'^(\d+)\s+(\w+)\s+(\w+)\s*(?:#.*)?$')
+_RELEVANCE_RE = re.compile(r'^\s*([-+0-9.eE]+)\s*,\s*([-+0-9.eE]+)\s*,\s*(\d+)\s*(?:%.*)?$')
+
+_DEFAULT_RELEVANCE = (0.0, 0.0, 0)
+
 class FileQueryLoader:
     """
     Loads benchmark queries from files
@@ -18,66 +24,80 @@ class FileQueryLoader:
         self.structured_query_path = Path(structured_query_path)
         self.relevance_path = Path(relevance_path)
         
-        self.query_pattern = re.compile(r'^query\s+([^#]+?)\s*(?:#.*)?$', re.IGNORECASE)
-        self.entry_pattern = re.compile(r'^(\d+)\s+(\w+)\s+(\w+)\s*(?:#.*)?$')
+        self.query_pattern = _QUERY_RE
+        self.entry_pattern = _ENTRY_RE
+        
+        self._lines_cache: Dict[Path, Tuple[int, List[str]]] = {}
     
     def _read_lines(self, filepath: Path) -> List[str]:
-        with open(filepath, 'r', encoding='utf-8') as f:
-            return [line.strip() for line in f 
-                   if line.strip() and not line.strip().startswith('#')]
+        """
+        Read non-empty, non-comment lines, reusing them while the file is unchanged
+        """
+        mtime = filepath.stat().st_mtime_ns
+        cached = self._lines_cache.get(filepath)
+        if cached is not None and cached[0] == mtime:
+            return cached[1]
+        
+        lines = []
+        append = lines.append
+        for line in filepath.read_bytes().decode('utf-8').splitlines():
+            stripped = line.strip()
+            if stripped and stripped[0] != '#':
+                append(stripped)
+        
+        self._lines_cache[filepath] = (mtime, lines)
+        return lines
     
-    def _load_relevance_data(self) -> Dict[int, Dict[str, float]]:
+    def _load_relevance_data(self) -> List[Optional[Tuple[float, float, int]]]:
+        """
+        Parse relevance lines into (precision, recall, relevant_docs) tuples by position,
+        with None for lines that could not be parsed
+        """
         try:
-            relevance_data = {}
+            relevance_data: List[Optional[Tuple[float, float, int]]] = []
+            append = relevance_data.append
             lines = self._read_lines(self.relevance_path)
             
             for i, line in enumerate(lines):
+                match = _RELEVANCE_RE.match(line)
+                if match is None:
+                    print(f"Warning: Skipping invalid line {i+1}: expected 'precision,recall,relevant_docs', got '{line}'")
+                    append(None)
+                    continue
+                
+                precision, recall, relevant_docs = match.groups()
                 try:
-                    if '%' in line:
-                        line = line.split('%')[0].strip()
-                    
-                    parts = [p.strip() for p in line.split(',')]
-                    if len(parts) != 3:
-                        print(f"Warning: Skipping invalid line {i+1}: expected 3 parts, got {len(parts)}")
-                        continue
-                    
-                    relevance_data[i] = {
-                        "precision": float(parts[0]),
-                        "recall": float(parts[1]),
-                        "relevant_docs": int(parts[2])
-                    }
-                except (ValueError, IndexError) as e:
+                    append((float(precision), float(recall), int(relevant_docs)))
+                except ValueError as e:
                     print(f"Warning: Skipping invalid line {i+1}: {str(e)}")
-                    continue
+                    append(None)
             
             return relevance_data
         except FileNotFoundError:
             print(f"Warning: Relevance file {self.relevance_path} not found. Using default values.")
-            return {}
+            return []
         except Exception as e:
             print(f"Error loading relevance data: {str(e)}")
-            return {}
+            return []
     
     def load_queries(self) -> List[BenchmarkQuery]:
         try:
             natural_queries = self._read_lines(self.natural_query_path)
             structured_queries = self._read_lines(self.structured_query_path)
             relevance_data = self._load_relevance_data()
+            relevance_count = len(relevance_data)
             
             queries = []
             for i, (natural, structured) in enumerate(zip(natural_queries, structured_queries)):
-                relevance = relevance_data.get(i, {
-                    "precision": 0.0,
-                    "recall": 0.0,
-                    "relevant_docs": 0
-                })
+                relevance = relevance_data[i] if i < relevance_count else None
+                precision, recall, relevant_docs = relevance or _DEFAULT_RELEVANCE
                 
                 queries.append(BenchmarkQuery(
                     natural_language=natural.strip(),
                     structured_query=structured.strip(),
-                    expected_precision=relevance["precision"],
-                    expected_recall=relevance["recall"],
-                    expected_relevant_docs=relevance["relevant_docs"]
+                    expected_precision=precision,
+                    expected_recall=recall,
+                    expected_relevant_docs=relevant_docs
                 ))
             
             return queries
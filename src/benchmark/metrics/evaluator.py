@@ -1,8 +1,65 @@
+import math
 from dataclasses import dataclass
-from typing import List, Dict
+from typing import List, Dict, Sequence, Tuple
 from ..engines.base import BenchmarkResult, SearchResult
+from ...compat import DATACLASS_SLOTS
 
-@dataclass
+def _build_discount_tables(n: int) -> Tuple[List[float], List[float]]:
+    discounts = [1.0 / math.log2(rank + 1) for rank in range(1, n + 1)]
+    ideal_dcg = [0.0]
+    for discount in discounts:
+        ideal_dcg.append(ideal_dcg[-1] + discount)
+    return discounts, ideal_dcg
+
+_DISCOUNT_TABLES = _build_discount_tables(4095)
+
+def _discount_tables(n: int) -> Tuple[List[float], List[float]]:
+    """
+    Log2 rank discounts 1 / log2(rank + 1) and their prefix sums (the ideal DCG of
+    k relevant hits), grown on demand to cover n ranks
+    """
+    global _DISCOUNT_TABLES
+    if n > len(_DISCOUNT_TABLES[0]):
+        _DISCOUNT_TABLES = _build_discount_tables(2 * n)
+    return _DISCOUNT_TABLES
+
+def _metrics_kernel(relevances: Sequence[float], 
+                    expected_relevant: int) -> Tuple[float, float, float, float]:
+    """
+    Compute precision, recall, average precision and NDCG of one ranking in a single pass
+    """
+    n = len(relevances)
+    if n == 0:
+        return 0.0, 0.0, 0.0, 0.0
+    
+    discounts, ideal_dcg = _discount_tables(n)
+    relevant_count = 0
+    ap_sum = 0.0
+    dcg = 0.0
+    for i, (relevance, discount) in enumerate(zip(relevances, discounts), 1):
+        dcg += relevance * discount
+        if relevance == 1.0:
+            relevant_count += 1
+            ap_sum += relevant_count / i
+    
+    if relevant_count + relevances.count(0.0) == n:
+        # Binary judgements: the ideal ranking puts every relevant hit first
+        idcg = ideal_dcg[relevant_count]
+    else:
+        idcg = sum(score * discount for score, discount in zip(sorted(relevances, reverse=True), discounts))
+    
+    if expected_relevant > 0:
+        precision = relevant_count / n
+        recall = relevant_count / expected_relevant
+    else:
+        precision, recall = 0.0, 0.0
+    
+    average_precision = ap_sum / relevant_count if relevant_count else 0.0
+    ndcg = dcg / idcg if idcg > 0 else 0.0
+    
+    return precision, recall, average_precision, ndcg
+
+@dataclass(**DATACLASS_SLOTS)
 class MetricResult:
     """
     Container for metric results
@@ -19,56 +76,26 @@ class MetricsEvaluator:
     Evaluates search results using basic IR metrics
     """
     
+    @staticmethod
+    def _relevances(results: List[SearchResult]) -> List[float]:
+        return [r.relevance for r in results]
+    
     def compute_precision_recall(self, results: List[SearchResult], 
                                expected_relevant: int) -> tuple[float, float]:
-        if not results or expected_relevant == 0:
-            return 0.0, 0.0
-        
-        relevant_results = sum(1 for r in results if r.relevance == 1.0)
-        
-        precision = relevant_results / len(results) if results else 0.0
-        recall = relevant_results / expected_relevant if expected_relevant > 0 else 0.0
-        
+        precision, recall, _, _ = _metrics_kernel(self._relevances(results), expected_relevant)
         return precision, recall
     
     def compute_average_precision(self, results: List[SearchResult]) -> float:
         """
         Compute Average Precision
         """
-        if not results:
-            return 0.0
-        
-        relevant_count = sum(1 for r in results if r.relevance == 1.0)
-        if relevant_count == 0:
-            return 0.0
-        
-        running_sum = 0.0
-        for i, result in enumerate(results, 1):
-            if result.relevance == 1.0:
-                relevant_so_far = sum(1 for r in results[:i] if r.relevance == 1.0)
-                running_sum += relevant_so_far / i
-        
-        return running_sum / relevant_count
+        return _metrics_kernel(self._relevances(results), 0)[2]
     
     def compute_ndcg(self, results: List[SearchResult]) -> float:
         """
         Compute Normalized Discounted Cumulative Gain
         """
-        if not results:
-            return 0.0
-            
-        scores = [r.relevance for r in results]
-        
-        dcg = scores[0]
-        for i, score in enumerate(scores[1:], 1):
-            dcg += score / (i + 1)
-            
-        ideal_scores = sorted(scores, reverse=True)
-        idcg = ideal_scores[0]
-        for i, score in enumerate(ideal_scores[1:], 1):
-            idcg += score / (i + 1)
-        
-        return dcg / idcg if idcg > 0 else 0.0
+        return _metrics_kernel(self._relevances(results), 0)[3]
 
     def evaluate(self, benchmark_result: BenchmarkResult) -> MetricResult:
         """
@@ -77,14 +104,12 @@ class MetricsEvaluator:
         results = benchmark_result.results
         query = benchmark_result.query
         
-        precision, recall = self.compute_precision_recall(
-            results, 
+        relevances = benchmark_result.relevances or self._relevances(results)
+        precision, recall, ap, ndcg = _metrics_kernel(
+            relevances,
             query.expected_relevant_docs
         )
         
-        ndcg = self.compute_ndcg(results)
-        ap = self.compute_average_precision(results)
-        
         return MetricResult(
             precision=precision,
             recall=recall,
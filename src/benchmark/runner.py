@@ -1,5 +1,6 @@
 import time
 import json
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import datetime
 from typing import List, Dict, Optional, Any
 from pathlib import Path
@@ -8,6 +9,41 @@ from .engines.base import BenchmarkEngine, BenchmarkQuery, BenchmarkResult
 from .loaders.file_loader import FileQueryLoader
 from .metrics.evaluator import MetricsEvaluator, MetricResult
 
+_WRITE_BUFFER_SIZE = 1 << 20
+
+def format_summary(metrics: Dict[str, MetricResult]) -> str:
+    """Format averaged metrics over all benchmark queries
+    
+    Args:
+        metrics: Per-query metrics as returned by BenchmarkRunner.run
+        
+    Returns:
+        Multi-line summary string
+    """
+    count = len(metrics)
+    totals = [0.0] * 6
+    for result in metrics.values():
+        totals[0] += result.precision
+        totals[1] += result.recall
+        totals[2] += result.ndcg
+        totals[3] += result.average_precision
+        totals[4] += result.execution_time
+        totals[5] += result.result_count
+    
+    precision, recall, ndcg, mean_ap, query_time, result_count = (
+        total / count if count else 0.0 for total in totals
+    )
+    
+    return (
+        f"Benchmark Results:\n"
+        f"  Mean Precision: {precision:.3f}\n"
+        f"  Mean Recall: {recall:.3f}\n"
+        f"  Mean NDCG: {ndcg:.3f}\n"
+        f"  Mean Average Precision: {mean_ap:.3f}\n"
+        f"  Average Query Time: {query_time:.3f}s\n"
+        f"  Average Result Count: {result_count:.1f}"
+    )
+
 class BenchmarkRunner:
     """
     Runs benchmarks and collects results
@@ -16,11 +52,35 @@ class BenchmarkRunner:
     def __init__(self, 
                  engine: BenchmarkEngine,
                  loader: FileQueryLoader,
-                 evaluator: MetricsEvaluator):
+                 evaluator: MetricsEvaluator,
+                 max_workers: Optional[int] = None,
+                 batch_size: int = 64):
         self.engine = engine
         self.loader = loader
         self.evaluator = evaluator
+        self.max_workers = max_workers
+        self.batch_size = max(1, batch_size)
         
+    @staticmethod
+    def _result_to_dict(result: BenchmarkResult) -> Dict[str, Any]:
+        """
+        Serializable view of a single benchmark result
+        """
+        return {
+            "query": result.query.natural_language,
+            "structured_query": result.query.structured_query,
+            "total_time": result.total_time,
+            "results": [
+                {
+                    "title": r.title,
+                    "score": r.score,
+                    "position": r.position,
+                    "relevance": r.relevance
+                }
+                for r in result.results
+            ]
+        }
+    
     def _save_results(self, 
                      raw_results: List[BenchmarkResult],
                      metrics: Dict[str, MetricResult]) -> None:
@@ -34,35 +94,14 @@ class BenchmarkRunner:
         output_dir = Path("./evaluation/results")
         output_dir.mkdir(parents=True, exist_ok=True)
         
-        raw_output = output_dir / f"raw_results_{timestamp}.json"
-        with open(raw_output, "w") as f:
-            json.dump(
-                {
-                    "timestamp": timestamp,
-                    "results": [
-                        {
-                            "query": result.query.natural_language,
-                            "structured_query": result.query.structured_query,
-                            "total_time": result.total_time,
-                            "results": [
-                                {
-                                    "title": r.title,
-                                    "score": r.score,
-                                    "position": r.position,
-                                    "relevance": r.relevance
-                                }
-                                for r in result.results
-                            ]
-                        }
-                        for result in raw_results
-                    ]
-                },
-                f,
-                indent=2
-            )
+        raw_output = output_dir / f"raw_results_{timestamp}.ndjson"
+        with open(raw_output, "w", encoding="utf-8", buffering=_WRITE_BUFFER_SIZE) as f:
+            for result in raw_results:
+                f.write(json.dumps(self._result_to_dict(result)))
+                f.write("\n")
         
         metrics_output = output_dir / f"metrics_{timestamp}.json"
-        with open(metrics_output, "w") as f:
+        with open(metrics_output, "w", encoding="utf-8", buffering=_WRITE_BUFFER_SIZE) as f:
             json.dump(
                 {
                     "timestamp": timestamp,
@@ -99,24 +138,46 @@ class BenchmarkRunner:
             raise ValueError("No queries loaded")
         
         start_time = time.time()
-        raw_results = []
         total_queries = len(queries)
+        ordered_results: List[Optional[BenchmarkResult]] = [None] * total_queries
+        ordered_metrics: List[Optional[MetricResult]] = [None] * total_queries
+        completed = 0
         
-        for i, query in enumerate(queries):
-            try:
-                result = self.engine.run_query(query)
-                raw_results.append(result)
+        max_workers = self.max_workers or min(32, total_queries)
+        try:
+            with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                for batch_start in range(0, total_queries, self.batch_size):
+                    batch = queries[batch_start:batch_start + self.batch_size]
+                    futures = {
+                        executor.submit(self.engine.run_query, query): batch_start + offset
+                        for offset, query in enumerate(batch)
+                    }
                 
-                if progress_callback:
-                    progress = int((i + 1) / total_queries * 100)
-                    progress_callback(progress)
-            except Exception as e:
-                print(f"Error running query '{query.natural_language}': {str(e)}")
-                continue
+                    for future in as_completed(futures):
+                        i = futures[future]
+                        try:
+                            result = future.result()
+                            ordered_results[i] = result
+                            # Evaluate while the remaining queries are still searching
+                            ordered_metrics[i] = self.evaluator.evaluate(result)
+                        except Exception as e:
+                            print(f"Error running query '{queries[i].natural_language}': {str(e)}")
+                    
+                        completed += 1
+                        if progress_callback:
+                            progress = int(completed / total_queries * 100)
+                            progress_callback(progress)
+        finally:
+            self.engine.cleanup()
         
-        total_time = time.time() - start_time
+        raw_results = [result for result in ordered_results if result is not None]
+        metrics = {
+            queries[i].natural_language: metric
+            for i, metric in enumerate(ordered_metrics)
+            if metric is not None
+        }
         
-        metrics = self.evaluator.evaluate_all(raw_results)
+        total_time = time.time() - start_time
         
         if save_results:
             self._save_results(raw_results, metrics)
@@ -1,5 +1,6 @@
 import time
 import click
+import functools
 from pathlib import Path
 from typing import Callable
 import importlib.util
@@ -23,17 +24,49 @@ class OrderedGroup(click.Group):
     def list_commands(self, ctx):
         return self.command_order
 
+@functools.lru_cache(maxsize=None)
 def is_module_available(module_name):
     """
     Check if a module is available
     """
-    return importlib.util.find_spec(module_name) is not None
+    try:
+        return importlib.util.find_spec(module_name) is not None
+    except (ImportError, ValueError):
+        return False
 
+@functools.lru_cache(maxsize=None)
 def import_or_none(module_name):
     if is_module_available(module_name):
         return importlib.import_module(module_name)
     return None
 
+def missing_modules(*module_names):
+    """
+    Return the names of the given modules that are not installed
+    """
+    return [name for name in module_names if not is_module_available(name)]
+
+def report_missing(task: str, modules: list) -> None:
+    click.echo(f"\nError: Missing dependencies for {task}: {', '.join(modules)}")
+    click.echo(f"Please install the required dependencies: pip install {' '.join(modules)}")
+
+def bar_progress_callback(bar, min_interval: float = 0.05) -> Callable[[int], None]:
+    """
+    Progress callback that redraws the bar at most every min_interval seconds
+    (always on completion)
+    """
+    last_redraw = 0.0
+    
+    def progress_callback(percent):
+        nonlocal last_redraw
+        now = time.monotonic()
+        if percent < 100 and now - last_redraw < min_interval:
+            return
+        last_redraw = now
+        bar.update(percent - bar.pos)
+    
+    return progress_callback
+
 def print_header(text: str):
     click.echo("\n" + "=" * 50)
     click.echo(f"  {text}")
@@ -52,14 +85,17 @@ def fetch(limit: int):
     """
     Fetch papers from CORE repository
     """
+    if missing := missing_modules('requests', 'lxml'):
+        report_missing("fetching papers", missing)
+        return
+    
     try:
         from .scraping import scrape_papers
         
         print_header("Fetching Papers")
         
         with click.progressbar(length=100, label='Fetching papers') as bar:
-            def progress_callback(percent):
-                bar.update(percent - bar.pos)
+            progress_callback = bar_progress_callback(bar)
             
             scrape_papers(limit, progress_callback)
             
@@ -75,14 +111,17 @@ def preprocess(wsd):
     """
     Preprocess fetched papers
     """
+    if missing := missing_modules('nltk', 'pdftotext'):
+        report_missing("preprocessing papers", missing)
+        return
+    
     try:
         from .preprocessing import preprocess_papers
         
         print_header("Preprocessing Papers")
         
         with click.progressbar(length=100, label='Preprocessing papers') as bar:
-            def progress_callback(percent):
-                bar.update(percent - bar.pos)
+            progress_callback = bar_progress_callback(bar)
             
             preprocess_papers(progress_callback, use_disambiguation=wsd)
             
@@ -94,14 +133,17 @@ def index():
     """
     Build the index
     """
+    if missing := missing_modules('whoosh'):
+        report_missing("indexing papers", missing)
+        return
+    
     try:
         from .indexing import build_index
         
         print_header("Indexing Papers")
         
         with click.progressbar(length=100, label='Indexing papers') as bar:
-            def progress_callback(percent):
-                bar.update(percent - bar.pos)
+            progress_callback = bar_progress_callback(bar)
             
             build_index(progress_callback)
             
@@ -115,6 +157,10 @@ def search(query: str, limit: int):
     """
     Search for papers
     """
+    if missing := missing_modules('whoosh'):
+        report_missing("searching", missing)
+        return
+    
     try:
         from .query_processing import process_query
         
@@ -158,15 +204,15 @@ def stats():
             click.echo(f"• Error retrieving index statistics: {str(e)}")
         
         data_dir = Path(DATA_DIR)
-        raw_count = len(list(data_dir.glob("raw/*.json"))) if data_dir.exists() else 0
-        processed_count = len(list(data_dir.glob("processed/*.json"))) if data_dir.exists() else 0
+        raw_count = sum(1 for _ in data_dir.glob("raw/*.json")) if data_dir.exists() else 0
+        processed_count = sum(1 for _ in data_dir.glob("processed/*.json")) if data_dir.exists() else 0
         
         click.echo("\nData Statistics:")
         click.echo(f"• Raw papers: {raw_count}")
         click.echo(f"• Processed papers: {processed_count}")
         
         benchmark_dir = Path(BENCHMARK_DIR)
-        query_sets = len(list(benchmark_dir.glob("*.json"))) if benchmark_dir.exists() else 0
+        query_sets = sum(1 for _ in benchmark_dir.glob("*.json")) if benchmark_dir.exists() else 0
         
         click.echo("\nBenchmark Statistics:")
         click.echo(f"• Available query sets: {query_sets}")
@@ -177,29 +223,31 @@ def stats():
 @cli.command()
 @click.option('--save/--no-save', default=True, help='Save benchmark results to file')
 @click.option('--detailed/--simple', default=False, help='Show detailed results')
-def benchmark(save: bool, detailed: bool):
+@click.option('--cache/--no-cache', default=False, help='Reuse cached search hits for an unchanged index')
+def benchmark(save: bool, detailed: bool, cache: bool):
     """
     Run benchmarks (experimental)
     """
     try:
         print_header("Running benchmarks (experimental)")
         
+        if missing := missing_modules('whoosh'):
+            report_missing("benchmarking", missing)
+            return
+        
         try:
-            from .benchmark.runner import BenchmarkRunner
+            from .benchmark.runner import BenchmarkRunner, format_summary
             from .benchmark.engines.whoosh_engine import WhooshBenchmarkEngine
             from .benchmark.loaders.file_loader import FileQueryLoader
             from .benchmark.metrics.evaluator import MetricsEvaluator
+            from .benchmark.cache import QueryCache
             from whoosh import index
         except ImportError as e:
             click.echo(f"\nError: Missing dependencies for benchmarking. {str(e)}")
             return
         
-        def progress_callback(percent):
-            if hasattr(progress_callback, 'bar'):
-                progress_callback.bar.update(percent - progress_callback.bar.pos)
-        
         with click.progressbar(length=100, label='Running benchmarks') as bar:
-            progress_callback.bar = bar
+            progress_callback = bar_progress_callback(bar)
             
             try:
                 query_loader = FileQueryLoader()
@@ -209,11 +257,16 @@ def benchmark(save: bool, detailed: bool):
                     return
                 
                 ix = index.open_dir(INDEX_DIR)
-                engine = WhooshBenchmarkEngine(index=ix)
-                evaluator = MetricsEvaluator()
-                
-                runner = BenchmarkRunner(engine, query_loader, evaluator)
-                results = runner.run(save_results=save, progress_callback=progress_callback)
+                query_cache = QueryCache() if cache else None
+                try:
+                    engine = WhooshBenchmarkEngine(index=ix, cache=query_cache)
+                    evaluator = MetricsEvaluator()
+                    
+                    runner = BenchmarkRunner(engine, query_loader, evaluator)
+                    results = runner.run(save_results=save, progress_callback=progress_callback)
+                finally:
+                    if query_cache is not None:
+                        query_cache.close()
             except Exception as e:
                 click.echo(f"\nError during benchmark initialization: {str(e)}")
                 return
@@ -236,14 +289,7 @@ def benchmark(save: bool, detailed: bool):
                 click.echo(f"  Result Count: {metrics.result_count}")
                 click.echo("")
         else:
-            click.echo("\nSummary Results:\n")
-            avg_precision = sum(m.precision for m in results.values()) / len(results) if results else 0
-            avg_recall = sum(m.recall for m in results.values()) / len(results) if results else 0
-            avg_ndcg = sum(m.ndcg for m in results.values()) / len(results) if results else 0
-            
-            click.echo(f"Average Precision: {avg_precision:.4f}")
-            click.echo(f"Average Recall: {avg_recall:.4f}")
-            click.echo(f"Average NDCG: {avg_ndcg:.4f}")
+            click.echo("\n" + format_summary(results))
             
     except Exception as e:
         click.echo(f"\nError running benchmark: {str(e)}")
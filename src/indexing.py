@@ -1,15 +1,24 @@
 import os
 import sys
 import logging
+import functools
 from datetime import datetime
-from typing import List, Optional, Dict, Protocol, runtime_checkable, Callable
+from typing import List, Optional, Dict, Protocol, Callable
 from whoosh.index import create_in, Index, exists_in, open_dir
 from whoosh.fields import Schema, TEXT, DATETIME, analysis
 from whoosh.writing import IndexWriter
 from whoosh.searching import Searcher
 from whoosh.qparser import QueryParser
-from dataclasses import dataclass
+from dataclasses import dataclass, field
+from pathlib import Path
+from importlib.util import find_spec
 from abc import ABC, abstractmethod
+from .compat import DATACLASS_SLOTS
+
+if find_spec("orjson") is not None:
+    from orjson import loads as _loads
+else:
+    from json import loads as _loads
 
 logging.basicConfig(
     level=logging.INFO,
@@ -17,7 +26,11 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
-@dataclass
+DOCS_FILENAME = "docs.jsonl"
+# Upper bound on indexing sub-processes, each one holds its own RAM buffer
+_MAX_WRITER_PROCS = 4
+
+@dataclass(**DATACLASS_SLOTS)
 class IndexableDocument:
     """
     Data class to hold document information for indexing
@@ -25,9 +38,8 @@ class IndexableDocument:
     title: str
     content: str
     abstract: str
-    date: datetime = datetime.now()
+    date: datetime = field(default_factory=datetime.now)
 
-@runtime_checkable
 class DocumentLoader(Protocol):
     """
     Protocol for document loading strategies
@@ -67,8 +79,6 @@ class FileSystemDocumentLoader(DocumentLoader):
                 
             title = filename[:-4] if filename.endswith('.txt') else filename
             
-            abstract_path = os.path.join(self.src_folder, filename)
-            
             tokens_filename = f"{title}_tokens.txt"
             tokens_path = os.path.join(self.src_folder, tokens_filename)
             
@@ -76,10 +86,7 @@ class FileSystemDocumentLoader(DocumentLoader):
                 logger.debug(f"Skipping {title}: No tokens file found")
                 return None
             
-            abstract = ""
-            if os.path.exists(abstract_path):
-                with open(abstract_path, 'r', encoding='utf-8') as f:
-                    abstract = f.read()
+            abstract = self.load_abstract(title)
             
             with open(tokens_path, 'r', encoding='utf-8') as f:
                 content = f.read()
@@ -99,6 +106,27 @@ class FileSystemDocumentLoader(DocumentLoader):
             logger.error(f"Unexpected error while loading document: {str(e)}")
         
         return None
+    
+    def load_record(self, record: Dict) -> IndexableDocument:
+        """
+        Build a document from a docs.jsonl record, the abstract still comes from {title}.txt
+        """
+        title = record["title"]
+        return IndexableDocument(
+            title=title,
+            content=' '.join(record["tokens"]),
+            abstract=self.load_abstract(title)
+        )
+    
+    def load_abstract(self, title: str) -> str:
+        """
+        Load the scraped abstract of a document, empty if there is none
+        """
+        abstract_path = os.path.join(self.src_folder, f"{title}.txt")
+        if not os.path.exists(abstract_path):
+            return ""
+        with open(abstract_path, 'r', encoding='utf-8') as f:
+            return f.read()
 
 class IndexManager:
     """
@@ -123,11 +151,24 @@ class IndexManager:
         else:
             return create_in(self.index_dir, self.schema)
     
-    def get_writer(self) -> IndexWriter:
+    def get_writer(self,
+                   limitmb: int = 256,
+                   procs: Optional[int] = None,
+                   multisegment: bool = False) -> IndexWriter:
         """
-        Get an index writer
+        Get an index writer tuned for batch indexing. limitmb is the RAM budget
+        of the whole writer, shared by the main writer and its sub-writers,
+        and the sub-writer segments are merged on commit
         """
-        return self.index.writer()
+        procs = procs or min(os.cpu_count() or 1, _MAX_WRITER_PROCS)
+        if procs <= 1:
+            return self.index.writer(limitmb=limitmb)
+        # MpWriter gives limitmb to the main writer and to each sub-writer
+        return self.index.writer(
+            limitmb=max(1, limitmb // (procs + 1)),
+            procs=procs,
+            multisegment=multisegment
+        )
     
     def get_searcher(self) -> Searcher:
         """
@@ -161,16 +202,36 @@ class WhooshIndexer(BaseIndexer):
         )
         
         self.index_manager = IndexManager(dst_folder, self.schema)
+        self._parsers: Dict[str, QueryParser] = {}
 
     def index_documents(self, progress_callback: Optional[Callable[[int], None]] = None) -> int:
         """
-        Index all documents in the source folder with progress
+        Index all documents in the source folder with progress, reading tokens
+        from the docs.jsonl artifact when preprocessing produced one
         """
-        files = [f for f in os.listdir(self.src_folder) if f.endswith('.txt')]
-        if not files:
+        docs_path = os.path.join(self.src_folder, DOCS_FILENAME)
+        if isinstance(self.document_loader, FileSystemDocumentLoader) and os.path.isfile(docs_path):
+            writer = self.index_manager.get_writer()
+            try:
+                return self._process_records(docs_path, writer, progress_callback)
+            except Exception as e:
+                logger.error(f"Error during indexing: {str(e)}")
+                writer.cancel()
+                raise
+        
+        with os.scandir(self.src_folder) as entries:
+            sizes = {
+                e.name: e.stat().st_size
+                for e in entries
+                if e.name.endswith('.txt') and e.is_file()
+            }
+        if not sizes:
             logger.error("Source directory is empty")
             raise ValueError("Source directory is empty")
 
+        # Largest documents first so the per-CPU sub-writers stay balanced
+        files = sorted(sizes, key=sizes.__getitem__, reverse=True)
+
         writer = self.index_manager.get_writer()
         try:
             return self._process_documents(files, writer, progress_callback)
@@ -188,6 +249,7 @@ class WhooshIndexer(BaseIndexer):
         """
         indexed_count = 0
         total_files = len(files)
+        last_progress = -1
         
         for i, f_name in enumerate(files):
             try:
@@ -197,8 +259,9 @@ class WhooshIndexer(BaseIndexer):
                     indexed_count += 1
                     logger.debug(f"Indexed document: {doc.title}")
                 
-                if progress_callback:
-                    progress = int((i + 1) / total_files * 100)
+                progress = int((i + 1) / total_files * 100)
+                if progress_callback and progress != last_progress:
+                    last_progress = progress
                     progress_callback(progress)
                     
             except Exception as e:
@@ -209,6 +272,39 @@ class WhooshIndexer(BaseIndexer):
         logger.info(f"Successfully indexed {indexed_count} documents")
         return indexed_count
 
+    def _process_records(self,
+                         docs_path: str,
+                         writer: IndexWriter,
+                         progress_callback: Optional[Callable[[int], None]] = None) -> int:
+        """
+        Stream and index docs.jsonl records, progress follows the bytes read
+        """
+        indexed_count = 0
+        total_bytes = os.path.getsize(docs_path) or 1
+        read_bytes = 0
+        last_progress = -1
+        
+        with open(docs_path, 'rb') as f:
+            for line in f:
+                read_bytes += len(line)
+                try:
+                    if line.strip():
+                        doc = self.document_loader.load_record(_loads(line))
+                        self._add_document_to_index(writer, doc)
+                        indexed_count += 1
+                        logger.debug(f"Indexed document: {doc.title}")
+                except Exception as e:
+                    logger.error(f"Failed to index record: {str(e)}")
+                
+                progress = int(read_bytes / total_bytes * 100)
+                if progress_callback and progress != last_progress:
+                    last_progress = progress
+                    progress_callback(progress)
+        
+        writer.commit()
+        logger.info(f"Successfully indexed {indexed_count} documents")
+        return indexed_count
+
     def _add_document_to_index(self, writer: IndexWriter, doc: IndexableDocument) -> None:
         writer.add_document(
             title=doc.title,
@@ -219,11 +315,75 @@ class WhooshIndexer(BaseIndexer):
 
     def search(self, query_string: str, field: str = "content") -> List[Dict]:
         with self.index_manager.get_searcher() as searcher:
-            query = QueryParser(field, self.schema).parse(query_string)
+            query = self._get_parser(field).parse(query_string)
             results = searcher.search(query)
             return [dict(result) for result in results]
 
-def get_index_stats() -> Dict[str, float]:
+    def search_many(self, query_strings: List[str], field: str = "content") -> List[List[Dict]]:
+        """
+        Run a batch of queries against a single searcher
+        """
+        parser = self._get_parser(field)
+        with self.index_manager.get_searcher() as searcher:
+            return [
+                [dict(result) for result in searcher.search(parser.parse(query_string))]
+                for query_string in query_strings
+            ]
+
+    def _get_parser(self, field: str) -> QueryParser:
+        """
+        Get the query parser for a field, built once per indexer
+        """
+        parser = self._parsers.get(field)
+        if parser is None:
+            parser = self._parsers[field] = QueryParser(field, self.schema)
+        return parser
+
+def _index_mtime(index_dir: str) -> float:
+    """
+    Latest modification time of the index TOC files, changes on every commit
+    """
+    return max((p.stat().st_mtime for p in Path(index_dir).glob('_*')), default=0.0)
+
+def _dir_size(path: str) -> int:
+    """
+    Total size in bytes of the files under path, using DirEntry stats
+    """
+    total = 0
+    stack = [path]
+    while stack:
+        with os.scandir(stack.pop()) as entries:
+            for entry in entries:
+                if entry.is_dir(follow_symlinks=False):
+                    stack.append(entry.path)
+                elif entry.is_file():
+                    total += entry.stat().st_size
+    return total
+
+@functools.lru_cache(maxsize=1)
+def _stats_cached(index_dir: str, mtime_key: float) -> Dict[str, float]:
+    """
+    Compute index statistics, memoized on the index mtime
+    """
+    index = open_dir(index_dir)
+    
+    doc_count = index.doc_count()
+    
+    unique_terms = 0
+    with index.reader() as reader:
+        for field_name in ['title', 'content', 'abstract']:
+            if field_name in reader.schema:
+                unique_terms += sum(1 for _ in reader.lexicon(field_name))
+    
+    index_size_mb = _dir_size(index_dir) / (1024 * 1024)
+    
+    return {
+        "doc_count": doc_count,
+        "unique_terms": unique_terms,
+        "index_size_mb": index_size_mb
+    }
+
+def get_index_stats(index_dir: str = './data/indexes/') -> Dict[str, float]:
     """Get statistics about the Whoosh index
     Returns:
         Dict containing:
@@ -232,34 +392,7 @@ def get_index_stats() -> Dict[str, float]:
         - index_size_mb: Size of the index in megabytes
     """
     try:
-        indexer = WhooshIndexer()
-        index = indexer.index_manager.index
-        
-        doc_count = index.doc_count()
-        
-        unique_terms = 0
-        with index.reader() as reader:
-            for field in ['title', 'content', 'abstract']:
-                if field in reader.schema:
-                    field_terms = set()
-                    for term in reader.lexicon(field):
-                        field_terms.add(term)
-                    unique_terms += len(field_terms)
-        
-        index_size = 0
-        index_dir = indexer.dst_folder
-        for dirpath, _, filenames in os.walk(index_dir):
-            for f in filenames:
-                fp = os.path.join(dirpath, f)
-                index_size += os.path.getsize(fp)
-        
-        index_size_mb = index_size / (1024 * 1024)
-        
-        return {
-            "doc_count": doc_count,
-            "unique_terms": unique_terms,
-            "index_size_mb": index_size_mb
-        }
+        return dict(_stats_cached(index_dir, _index_mtime(index_dir)))
         
     except Exception as e:
         logger.error(f"Error getting index statistics: {str(e)}")
@@ -1,14 +1,17 @@
+from __future__ import annotations
+
 import os
-import sys
+import re
+import json
 import logging
-import pdftotext
-from nltk import word_tokenize, pos_tag
-from nltk.corpus import wordnet
-from nltk.corpus import stopwords
-from nltk.stem import WordNetLemmatizer
-from typing import List, Optional, Dict, Tuple, Protocol, runtime_checkable, Callable
+from concurrent.futures import ProcessPoolExecutor
+from typing import TYPE_CHECKING, List, Optional, Dict, Tuple, Protocol, Callable, Iterator, TextIO, Type
 from dataclasses import dataclass
 from abc import ABC, abstractmethod
+from .compat import DATACLASS_SLOTS
+
+if TYPE_CHECKING:
+    from nltk.corpus.reader.wordnet import Synset
 
 logging.basicConfig(
     level=logging.INFO,
@@ -16,17 +19,50 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
-@dataclass
+DOCS_FILENAME = "docs.jsonl"
+
+_WORD_RE = re.compile(r"[^\W\d_]+")
+
+_PENN_TAGS = (
+    "CC", "CD", "DT", "EX", "FW", "IN", "JJ", "JJR", "JJS", "LS", "MD",
+    "NN", "NNS", "NNP", "NNPS", "PDT", "POS", "PRP", "PRP$", "RB", "RBR",
+    "RBS", "RP", "SYM", "TO", "UH", "VB", "VBD", "VBG", "VBN", "VBP",
+    "VBZ", "WDT", "WP", "WP$", "WRB"
+)
+
+_STOPWORDS: Optional[frozenset] = None
+_LEMMATIZER = None
+
+def _get_stopwords() -> frozenset:
+    """
+    English stopwords, loaded once per process
+    """
+    global _STOPWORDS
+    if _STOPWORDS is None:
+        from nltk.corpus import stopwords
+        _STOPWORDS = frozenset(stopwords.words("english"))
+    return _STOPWORDS
+
+def _get_lemmatizer():
+    """
+    Shared WordNet lemmatizer, created once per process
+    """
+    global _LEMMATIZER
+    if _LEMMATIZER is None:
+        from nltk.stem import WordNetLemmatizer
+        _LEMMATIZER = WordNetLemmatizer()
+    return _LEMMATIZER
+
+@dataclass(**DATACLASS_SLOTS)
 class ProcessedDocument:
     """
     Data class to hold processed document information
     """
     title: str
     tokens: List[str]
-    raw_text: str
+    raw_text: Optional[str] = None
     disambiguated_terms: Optional[List[Tuple[str, Optional[str]]]] = None
 
-@runtime_checkable
 class TextProcessor(Protocol):
     """
     Protocol defining the interface for text processors
@@ -54,17 +90,27 @@ class NLTKTextProcessor:
     """
     
     def __init__(self):
-        self.stops = set(stopwords.words("english"))
-        self.lemmatizer = WordNetLemmatizer()
+        self.stops = _get_stopwords()
+        self.lemmatizer = _get_lemmatizer()
+        self._lemma_cache: Dict[str, str] = {}
     
     def process_text(self, text: str) -> List[str]:
-        """Process text using NLTK tokenization and lemmatization."""
-        tokens = word_tokenize(text)
-        return [
-            self.lemmatizer.lemmatize(token.lower()) 
-            for token in tokens 
-            if token.isalpha() and token.lower() not in self.stops
-        ]
+        """Extract alphabetic words, drop stopwords and lemmatize (memoized per surface form)."""
+        return list(self.process_text_iter(text))
+    
+    def process_text_iter(self, text: str) -> Iterator[str]:
+        """Lazily yield the lemmas produced by process_text."""
+        stops = self.stops
+        lemmas = self._lemma_cache
+        lemmatize = self.lemmatizer.lemmatize
+        
+        for token in _WORD_RE.findall(text.lower()):
+            if token in stops:
+                continue
+            lemma = lemmas.get(token)
+            if lemma is None:
+                lemma = lemmas[token] = lemmatize(token)
+            yield lemma
 
 class WordSenseDisambiguator:
     """
@@ -72,61 +118,91 @@ class WordSenseDisambiguator:
     """
     
     def __init__(self):
+        from nltk import pos_tag
+        from nltk.corpus import wordnet
+        
+        self._wordnet = wordnet
+        self._pos_tag = pos_tag
         self._pos_map = {
             "J": wordnet.ADJ,
             "V": wordnet.VERB,
             "N": wordnet.NOUN,
             "R": wordnet.ADV
         }
+        self._full_pos_map = {
+            tag: self._pos_map.get(tag[0], wordnet.NOUN) for tag in _PENN_TAGS
+        }
+        self._synset_cache: Dict[Tuple[str, Optional[str]], list] = {}
     
     def disambiguate(self, terms: List[str]) -> List[Tuple[str, Optional[str]]]:
         """
         Disambiguate a list of terms and return Synset names
         """
-        tagged_terms = pos_tag(terms)
+        tagged_terms = self._pos_tag(terms)
+        full_pos_map = self._full_pos_map
+        noun = self._wordnet.NOUN
+        wordnet_pos_list = [full_pos_map.get(tag, noun) for _, tag in tagged_terms]
         results = []
         
-        for idx, (term, tag) in enumerate(tagged_terms):
-            best_sense = self._find_best_sense(term, tag, tagged_terms, idx)
+        for idx, (term, _) in enumerate(tagged_terms):
+            best_sense = self._find_best_sense(term, wordnet_pos_list[idx], tagged_terms, idx)
             results.append((term, best_sense.name() if best_sense else None))
             self._log_disambiguation_result(term, best_sense)
         
         return results
     
-    def _find_best_sense(self, term: str, tag: str, 
+    def _find_best_sense(self, term: str, wordnet_pos: str, 
                          tagged_terms: List[Tuple[str, str]], 
-                         idx: int) -> Optional[wordnet.synsets]:
+                         idx: int) -> Optional[Synset]:
         """
         Find the best sense for a term based on context
         """
         best_sense = None
         max_score = 0.0
-        wordnet_pos = self._get_wordnet_pos(tag)
         
         start = max(0, idx - 5)
         end = min(len(tagged_terms), idx + 6)
         context_terms = [t for t, _ in tagged_terms[start:end] if t != term]
+        context_synsets = [self._synsets(context_term) for context_term in context_terms]
         
-        for sense in wordnet.synsets(term, pos=wordnet_pos):
-            context_score = self._compute_context_score(sense, context_terms)
+        for sense in self._synsets(term, wordnet_pos):
+            context_score = self._compute_context_score(sense, context_synsets, max_score)
             if context_score > max_score:
                 best_sense = sense
                 max_score = context_score
         
         return best_sense
     
-    def _compute_context_score(self, sense, context_terms: List[str]) -> float:
+    def _synsets(self, term: str, pos: Optional[str] = None) -> list:
         """
-        Compute context similarity score
+        WordNet synsets of a term, memoized across the whole run
         """
-        return sum(
-            max(
-                (similarity for context_sense in wordnet.synsets(context_term)
-                 if (similarity := self._safe_similarity(sense, context_sense)) is not None),
-                default=0.0
-            )
-            for context_term in context_terms
-        )
+        key = (term, pos)
+        synsets = self._synset_cache.get(key)
+        if synsets is None:
+            synsets = self._synset_cache[key] = self._wordnet.synsets(term, pos=pos)
+        return synsets
+    
+    def _compute_context_score(self, sense, context_synsets: List[list], threshold: float = 0.0) -> float:
+        """
+        Compute context similarity score, stopping early once it cannot exceed threshold
+        """
+        score = 0.0
+        remaining = len(context_synsets)
+        for synsets in context_synsets:
+            remaining -= 1
+            best = 0.0
+            for context_sense in synsets:
+                similarity = self._safe_similarity(sense, context_sense)
+                if similarity is not None and similarity > best:
+                    best = similarity
+                    if best >= 1.0:
+                        break
+            score += best
+            # Path similarity is at most 1.0 per context term
+            if score + remaining <= threshold:
+                break
+        return score
     
     def _safe_similarity(self, sense1, sense2) -> Optional[float]:
         """
@@ -142,7 +218,7 @@ class WordSenseDisambiguator:
         """
         Convert Penn Treebank POS tags to WordNet POS tags
         """
-        return self._pos_map.get(treebank_tag[0], wordnet.NOUN)
+        return self._full_pos_map.get(treebank_tag, self._wordnet.NOUN)
     
     def _log_disambiguation_result(self, term: str, sense) -> None:
         if sense:
@@ -159,12 +235,14 @@ class PDFDocumentProcessor(BaseDocumentProcessor):
                  src_folder: str = "./data/pdf_downloads/", 
                  dst_folder: str = "./data/txt/",
                  text_processor: Optional[TextProcessor] = None,
-                 use_disambiguation: bool = False):
+                 use_disambiguation: bool = False,
+                 max_workers: Optional[int] = None):
         """
         Initialize the PDF document processor
         """
         self.src_folder = src_folder
         self.dst_folder = dst_folder
+        self.max_workers = max_workers
         self.text_processor = text_processor or NLTKTextProcessor()
         self.disambiguator = WordSenseDisambiguator() if use_disambiguation else None
         
@@ -176,25 +254,47 @@ class PDFDocumentProcessor(BaseDocumentProcessor):
         """
         Process all PDF documents in the source folder with progress
         """
-        files = [f for f in os.listdir(self.src_folder) if f.endswith('.pdf')]
+        with os.scandir(self.src_folder) as entries:
+            files = [e.name for e in entries if e.name.endswith('.pdf') and e.is_file()]
         if not files:
             logger.error("Source directory is empty")
             raise ValueError("Source directory is empty")
         
         processed_docs = []
         total_files = len(files)
+        docs_path = os.path.join(self.dst_folder, DOCS_FILENAME)
+        last_progress = -1
         
-        for i, f_name in enumerate(files):
-            if doc := self.process_single_document(f_name):
-                processed_docs.append(doc)
-                self._save_tokens(doc)
-            
-            if progress_callback:
+        with open(docs_path, 'w', encoding='utf-8', buffering=1 << 16) as out:
+            for i, doc in enumerate(self._process_files(files)):
+                if doc:
+                    processed_docs.append(doc)
+                    self._save_tokens(doc, out)
+                
                 progress = int((i + 1) / total_files * 100)
-                progress_callback(progress)
+                if progress_callback and progress != last_progress:
+                    last_progress = progress
+                    progress_callback(progress)
+        logger.debug(f"Saved tokens to {docs_path}")
         
         return processed_docs
     
+    def _process_files(self, files: List[str]) -> Iterator[Optional[ProcessedDocument]]:
+        """
+        Process files across worker processes, yielding results in input order
+        """
+        workers = min(self.max_workers or os.cpu_count() or 1, len(files))
+        if workers <= 1:
+            yield from map(self.process_single_document, files)
+            return
+        
+        with ProcessPoolExecutor(
+            max_workers=workers,
+            initializer=_init_worker,
+            initargs=(type(self), self.src_folder, self.dst_folder, self.text_processor, self.disambiguator is not None)
+        ) as executor:
+            yield from executor.map(_process_in_worker, files, chunksize=4)
+    
     def process_single_document(self, filename: str) -> Optional[ProcessedDocument]:
         """
         Process a single PDF document
@@ -203,12 +303,12 @@ class PDFDocumentProcessor(BaseDocumentProcessor):
         logger.info(f"Processing file: {filename}")
         
         try:
-            raw_text = self._extract_pdf_text(raw_f_path)
-            
-            tokens = self.text_processor.process_text(raw_text)
+            tokens: List[str] = []
+            for page in self._extract_pdf_pages(raw_f_path):
+                tokens.extend(self.text_processor.process_text(page))
             
             title = os.path.splitext(filename)[0]
-            doc = ProcessedDocument(title=title, tokens=tokens, raw_text=raw_text)
+            doc = ProcessedDocument(title=title, tokens=tokens)
             
             if self.disambiguator:
                 doc.disambiguated_terms = self.disambiguator.disambiguate(tokens)
@@ -219,27 +319,69 @@ class PDFDocumentProcessor(BaseDocumentProcessor):
             logger.error(f"Error processing {filename}: {e}")
             return None
     
-    def _extract_pdf_text(self, filepath: str) -> str:
+    def _extract_pdf_pages(self, filepath: str) -> Iterator[str]:
         """
-        Extract text from PDF file
+        Extract text from PDF file one page at a time
         """
+        import pdftotext
+        
         with open(filepath, "rb") as f:
             pdf = pdftotext.PDF(f)
-        return "\n\n".join(pdf)
+        yield from pdf
     
-    def _save_tokens(self, doc: ProcessedDocument) -> None:
+    def _save_tokens(self, doc: ProcessedDocument, out: TextIO) -> None:
         """
-        Save processed tokens
+        Append processed tokens as one JSON line of the docs artifact
         """
-        tokens_file = os.path.join(self.dst_folder, f"{doc.title}_tokens.txt")
-        
         try:
-            with open(tokens_file, 'w', encoding='utf-8') as f:
-                f.write('\n'.join(doc.tokens))
-            logger.debug(f"Saved tokens to {tokens_file}")
+            out.write(json.dumps({"title": doc.title, "tokens": doc.tokens}) + '\n')
         except Exception as e:
             logger.error(f"Error saving tokens for {doc.title}: {e}")
 
+_worker_processor: Optional[PDFDocumentProcessor] = None
+
+def _init_worker(processor_cls: Type[PDFDocumentProcessor],
+                 src_folder: str, 
+                 dst_folder: str, 
+                 text_processor: TextProcessor, 
+                 use_disambiguation: bool) -> None:
+    """
+    Build one processor per worker process so NLTK resources load once per worker,
+    using the parent's processor class so subclass overrides apply in workers too
+    """
+    global _worker_processor
+    _warm_up_nltk(isinstance(text_processor, NLTKTextProcessor), use_disambiguation)
+    _worker_processor = processor_cls(
+        src_folder=src_folder,
+        dst_folder=dst_folder,
+        text_processor=text_processor,
+        use_disambiguation=use_disambiguation,
+        max_workers=1
+    )
+
+def _warm_up_nltk(use_text_processor: bool, use_disambiguation: bool) -> None:
+    """
+    Load the lazily-loaded NLTK corpora and tagger the worker will use, before
+    the first document
+    """
+    if not (use_text_processor or use_disambiguation):
+        return
+    
+    from nltk import pos_tag
+    from nltk.corpus import stopwords, wordnet
+    
+    try:
+        wordnet.ensure_loaded()
+        if use_text_processor:
+            stopwords.ensure_loaded()
+        if use_disambiguation:
+            pos_tag(["init"])
+    except LookupError as e:
+        logger.warning(f"NLTK warm-up failed: {e}")
+
+def _process_in_worker(filename: str) -> Optional[ProcessedDocument]:
+    return _worker_processor.process_single_document(filename)
+
 def preprocess_papers(progress_callback: Optional[Callable[[int], None]] = None, use_disambiguation: bool = False) -> None:
     """
     Process all papers in the download directory
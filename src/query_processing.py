@@ -1,12 +1,23 @@
+import os
 import re
+import sys
+import math
+import heapq
+import atexit
 import logging
-from typing import List, Dict, Optional, Protocol
+import functools
+import threading
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from operator import itemgetter
+from typing import List, Dict, Optional, Protocol, Tuple
 from dataclasses import dataclass
 from whoosh.qparser import MultifieldParser, OrGroup, AndGroup, QueryParser
 from whoosh import scoring, index
 from whoosh.fields import Schema
 from whoosh.searching import Searcher, Results
-from whoosh.query import Query
+from whoosh.query import Query, QueryError
+from whoosh.reading import TermNotFound
 from abc import ABC, abstractmethod
 
 logging.basicConfig(
@@ -15,6 +26,13 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+_AND_RE = re.compile(r'\bAND\b', re.IGNORECASE)
+# Title, abstract and score of one search hit
+_Hit = Tuple[str, str, float]
+
+_engine_singleton: Optional["WhooshSearchEngine"] = None
+_engine_lock = threading.Lock()
+
 @dataclass
 class SearchResult:
     """
@@ -34,27 +52,41 @@ class QueryStrategy(Protocol):
         """Parse a query string into a Whoosh Query object."""
         ...
 
-class AndQueryStrategy:
+class MultifieldQueryStrategy:
     """
-    Strategy for AND queries
+    Base strategy parsing over title, abstract and content with one parser
+    per schema, memoizing parsed queries
     """
     
+    group = OrGroup
+    
+    def __init__(self):
+        self._schema: Optional[Schema] = None
+        self._parser: Optional[MultifieldParser] = None
+        self._parse_cached = None
+    
     def parse_query(self, query_string: str, schema: Schema) -> Query:
-        parser = MultifieldParser(["title", "abstract", "content"], 
-                                schema=schema, 
-                                group=AndGroup)
-        return parser.parse(query_string)
+        if schema is not self._schema:
+            self._schema = schema
+            self._parser = MultifieldParser(["title", "abstract", "content"], 
+                                            schema=schema, 
+                                            group=self.group)
+            self._parse_cached = functools.lru_cache(maxsize=512)(self._parser.parse)
+        return self._parse_cached(query_string)
 
-class OrQueryStrategy:
+class AndQueryStrategy(MultifieldQueryStrategy):
+    """
+    Strategy for AND queries
+    """
+    
+    group = AndGroup
+
+class OrQueryStrategy(MultifieldQueryStrategy):
     """
     Strategy for OR queries
     """
     
-    def parse_query(self, query_string: str, schema: Schema) -> Query:
-        parser = MultifieldParser(["title", "abstract", "content"], 
-                                schema=schema, 
-                                group=OrGroup)
-        return parser.parse(query_string)
+    group = OrGroup
 
 class BaseSearchEngine(ABC):
     """
@@ -80,23 +112,67 @@ class WhooshSearchEngine(BaseSearchEngine):
     Whoosh-based implementation of search engine
     """
     
-    def __init__(self, index_path: str = "./data/indexes"):
+    def __init__(self, 
+                 index_path: str = "./data/indexes",
+                 warm_cache: bool = False,
+                 warmup_queries: Optional[List[str]] = None,
+                 warmup_limits: Tuple[int, ...] = (5, 10)):
 
         self.index_path = index_path
         self.index = index.open_dir(index_path)
-        self.searcher = self.index.searcher(
-            weighting=scoring.BM25F(B=0.75, content_B=1.0, K1=1.2)
-        )
+        self.searcher = self._open_searcher()
         self.or_strategy = OrQueryStrategy()
         self.and_strategy = AndQueryStrategy()
+        # Raw hits keyed on (query, limit), shaped into results or dicts per call
+        self._cache: "OrderedDict[Tuple[str, int], List[_Hit]]" = OrderedDict()
+        self._cache_max = 1024
+        self._cache_lock = threading.Lock()
+        # Serializes use of the shared searcher, search_many threads use their own
+        self._searcher_lock = threading.Lock()
+        
+        if warm_cache:
+            self._warm_page_cache()
+        # The defaults cover search() and process_query, the two usual entry points
+        for query in warmup_queries or ():
+            for limit in warmup_limits:
+                self._search(query, limit, self.searcher)
     
-    def __del__(self):
+    def _warm_page_cache(self) -> None:
         """
-        Clean up resources
+        Read every index file once so the first queries hit the OS page cache
         """
-        if hasattr(self, 'searcher'):
+        buf = bytearray(1 << 20)
+        with os.scandir(self.index_path) as entries:
+            for entry in entries:
+                if not entry.is_file() or entry.name.endswith("WRITELOCK"):
+                    continue
+                with open(entry.path, 'rb', buffering=0) as f:
+                    while f.readinto(buf):
+                        pass
+    
+    def _open_searcher(self) -> Searcher:
+        return self.index.searcher(
+            weighting=scoring.BM25F(B=0.75, content_B=1.0, K1=1.2)
+        )
+    
+    def close(self) -> None:
+        """
+        Close the underlying searcher
+        """
+        with self._searcher_lock:
             self.searcher.close()
     
+    def refresh(self) -> None:
+        """
+        Pick up new index segments, dropping cached results if the index changed
+        """
+        with self._searcher_lock:
+            searcher = self.searcher.refresh()
+            if searcher is not self.searcher:
+                self.searcher = searcher
+                with self._cache_lock:
+                    self._cache.clear()
+    
     def search(self, query: str, limit: int = 5) -> List[SearchResult]:
         """
         Perform a search using the appropriate query strategy
@@ -108,16 +184,80 @@ class WhooshSearchEngine(BaseSearchEngine):
         Returns:
             List of SearchResult objects
         """
+        with self._searcher_lock:
+            return self._to_results(self._search(query, limit, self.searcher))
+    
+    def search_dicts(self, query: str, limit: int = 5) -> List[Dict]:
+        """
+        Perform a search returning plain title/abstract/score dicts
+        
+        Args:
+            query: Query string
+            limit: Maximum number of results to return
+            
+        Returns:
+            List of dictionaries containing search results
+        """
+        with self._searcher_lock:
+            return self._to_dicts(self._search(query, limit, self.searcher))
+    
+    def search_many(self, queries: List[str], limit: int = 5) -> List[List[SearchResult]]:
+        """
+        Run several queries concurrently, each worker thread with its own searcher
+        
+        Args:
+            queries: Query strings
+            limit: Maximum number of results per query
+            
+        Returns:
+            One list of SearchResult objects per query, in input order
+        """
+        if not queries:
+            return []
+        
+        local = threading.local()
+        searchers: List[Searcher] = []
+        
+        def run(query: str) -> List[SearchResult]:
+            searcher = getattr(local, "searcher", None)
+            if searcher is None:
+                searcher = local.searcher = self._open_searcher()
+                searchers.append(searcher)
+            return self._to_results(self._search(query, limit, searcher))
+        
+        try:
+            with ThreadPoolExecutor(max_workers=min(os.cpu_count() or 1, len(queries))) as executor:
+                return list(executor.map(run, queries))
+        finally:
+            for searcher in searchers:
+                searcher.close()
+    
+    def _search(self, query: str, limit: int, searcher: Searcher) -> List[_Hit]:
+        """
+        Search through the result cache, the returned list must not be modified
+        """
         query = query.lower()
+        key = (query, limit)
+        with self._cache_lock:
+            cached = self._cache.get(key)
+            if cached is not None:
+                self._cache.move_to_end(key)
+                return cached
+        
         strategy = self._select_query_strategy(query)
         
         try:
             whoosh_query = strategy.parse_query(query, self.searcher.schema)
-            results = self.searcher.search(whoosh_query, limit=limit)
-            return self._process_results(results)
-        except Exception as e:
+            hits = self._extract_hits(searcher.search(whoosh_query, limit=limit))
+        except (QueryError, TermNotFound, OSError) as e:
             logger.error(f"Search error: {str(e)}")
             return []
+        
+        with self._cache_lock:
+            self._cache[key] = hits
+            if len(self._cache) > self._cache_max:
+                self._cache.popitem(last=False)
+        return hits
     
     def suggest_correction(self, query: str) -> Optional[str]:
         """
@@ -129,14 +269,39 @@ class WhooshSearchEngine(BaseSearchEngine):
         Returns:
             Corrected query string if available, None otherwise
         """
+        with self._searcher_lock:
+            return self._correct(query)
+    
+    def search_with_correction(self, query: str, limit: int = 5) -> Tuple[List[SearchResult], Optional[str]]:
+        """
+        Perform a search, suggesting a correction only when nothing matched
+        
+        Args:
+            query: Query string
+            limit: Maximum number of results to return
+            
+        Returns:
+            List of SearchResult objects and the corrected query string, if any
+        """
+        with self._searcher_lock:
+            results = self._to_results(self._search(query, limit, self.searcher))
+            if results:
+                return results, None
+            return results, self._correct(query)
+    
+    def _correct(self, query: str) -> Optional[str]:
+        """
+        Correct a query with the shared searcher, the caller holds the searcher lock
+        """
+        query = query.lower()
         try:
-            strategy = self._select_query_strategy(query)
-            whoosh_query = strategy.parse_query(query.lower(), self.searcher.schema)
-            corrected = self.searcher.correct_query(whoosh_query, query.lower())
+            # Parsing is memoized by the strategy, so this reuses the query parsed by _search
+            whoosh_query = self._select_query_strategy(query).parse_query(query, self.searcher.schema)
+            corrected = self.searcher.correct_query(whoosh_query, query)
             
             if corrected.query != whoosh_query:
                 return corrected.string
-        except Exception as e:
+        except (QueryError, TermNotFound, OSError) as e:
             logger.error(f"Correction suggestion error: {str(e)}")
         
         return None
@@ -145,32 +310,167 @@ class WhooshSearchEngine(BaseSearchEngine):
         """
         Select appropriate query strategy based on query content
         """
-        return self.and_strategy if re.search(r'\bAND\b', query, re.IGNORECASE) else self.or_strategy
+        if "and" not in query.lower():
+            return self.or_strategy
+        return self.and_strategy if _AND_RE.search(query) else self.or_strategy
     
-    def _process_results(self, results: Results) -> List[SearchResult]:
+    def _extract_hits(self, results: Results) -> List[_Hit]:
         """
-        Convert Whoosh results to SearchResult objects
+        Read the title, abstract and score of each Whoosh hit
         """
+        return [
+            (fields["title"], fields.get("abstract", ""), r.score)
+            for r in results
+            for fields in (r.fields(),)
+        ]
+    
+    @staticmethod
+    def _to_results(hits: List[_Hit]) -> List[SearchResult]:
+        """
+        Convert hits to SearchResult objects
+        """
+        return [
+            SearchResult(title=title, abstract=abstract, score=score, rank=rank)
+            for rank, (title, abstract, score) in enumerate(hits)
+        ]
+    
+    @staticmethod
+    def _to_dicts(hits: List[_Hit]) -> List[Dict]:
+        """
+        Convert hits to the dicts returned by process_query
+        """
+        return [
+            {"title": title, "abstract": abstract, "score": score}
+            for title, abstract, score in hits
+        ]
+
+class BM25SSearchEngine(BaseSearchEngine):
+    """
+    In-memory BM25F engine with eagerly computed term weights (BM25S)
+    
+    Every (term, document) BM25F weight is computed once at construction from
+    the stored fields of the Whoosh index, so a query is just a sum over the
+    precomputed postings of its terms.
+    """
+    
+    FIELDS = ("title", "abstract", "content")
+    
+    def __init__(self,
+                 index_path: str = "./data/indexes",
+                 k1: float = 1.2,
+                 b: float = 0.75,
+                 field_b: Optional[Dict[str, float]] = None):
+        self.index_path = index_path
+        self.index = index.open_dir(index_path)
+        self.schema = self.index.schema
+        self.analyzer = self.schema["content"].analyzer
+        self._parser = MultifieldParser(list(self.FIELDS), schema=self.schema, group=OrGroup)
+        
+        self._docs: List[Tuple[str, str]] = []
+        self._postings: Dict[str, Tuple[List[int], List[float]]] = {}
+        self._build(k1, b, field_b if field_b is not None else {"content": 1.0})
+    
+    def _tokenize(self, text: str) -> List[str]:
+        return [token.text for token in self.analyzer(text)]
+    
+    def _build(self, k1: float, b: float, field_b: Dict[str, float]) -> None:
+        """
+        Precompute the BM25F weight of every term in every document, summed
+        over the fields the way Whoosh scores a multifield OR query
+        """
+        field_terms: Dict[str, List[Dict[str, int]]] = {name: [] for name in self.FIELDS}
+        with self.index.searcher() as searcher:
+            for fields in searcher.all_stored_fields():
+                self._docs.append((fields.get("title", ""), fields.get("abstract", "")))
+                for name in self.FIELDS:
+                    counts: Dict[str, int] = {}
+                    for term in self._tokenize(fields.get(name) or ""):
+                        counts[term] = counts.get(term, 0) + 1
+                    field_terms[name].append(counts)
+        
+        num_docs = len(self._docs)
+        if not num_docs:
+            return
+        
+        weights: Dict[str, Dict[int, float]] = {}
+        for name, doc_terms in field_terms.items():
+            lengths = [sum(counts.values()) for counts in doc_terms]
+            avg_length = (sum(lengths) / num_docs) or 1.0
+            field_b_value = field_b.get(name, b)
+            
+            df: Dict[str, int] = {}
+            for counts in doc_terms:
+                for term in counts:
+                    df[term] = df.get(term, 0) + 1
+            
+            for doc_id, counts in enumerate(doc_terms):
+                norm = k1 * (1 - field_b_value + field_b_value * lengths[doc_id] / avg_length)
+                for term, tf in counts.items():
+                    idf = math.log(num_docs / (df[term] + 1)) + 1
+                    term_weights = weights.setdefault(term, {})
+                    term_weights[doc_id] = term_weights.get(doc_id, 0.0) + idf * tf * (k1 + 1) / (tf + norm)
+        
+        self._postings = {
+            term: (list(term_weights), list(term_weights.values()))
+            for term, term_weights in weights.items()
+        }
+    
+    def search(self, query: str, limit: int = 5) -> List[SearchResult]:
+        """
+        Score documents by summing the precomputed weights of the query terms
+        
+        Args:
+            query: Query string
+            limit: Maximum number of results to return
+            
+        Returns:
+            List of SearchResult objects
+        """
+        scores: Dict[int, float] = {}
+        for term in set(self._tokenize(query.lower())):
+            postings = self._postings.get(term)
+            if postings is None:
+                continue
+            for doc_id, weight in zip(*postings):
+                scores[doc_id] = scores.get(doc_id, 0.0) + weight
+        
+        top = heapq.nlargest(limit, scores.items(), key=itemgetter(1))
         return [
             SearchResult(
-                title=r["title"],
-                abstract=r["abstract"],
-                score=r.score,
-                rank=r.rank
+                title=self._docs[doc_id][0],
+                abstract=self._docs[doc_id][1],
+                score=score,
+                rank=rank
             )
-            for r in results
+            for rank, (doc_id, score) in enumerate(top)
         ]
+    
+    def suggest_correction(self, query: str) -> Optional[str]:
+        """
+        Suggest a correction using the spelling data of the Whoosh index
+        """
+        try:
+            whoosh_query = self._parser.parse(query.lower())
+            with self.index.searcher() as searcher:
+                corrected = searcher.correct_query(whoosh_query, query.lower())
+            
+            if corrected.query != whoosh_query:
+                return corrected.string
+        except (QueryError, TermNotFound, OSError) as e:
+            logger.error(f"Correction suggestion error: {str(e)}")
+        
+        return None
 
 def format_results(results: List[SearchResult]) -> None:
-    print("\n---------------------")
-    print("     Results     ")
-    print("---------------------")
-    
+    buf = ["\n---------------------\n     Results     \n---------------------\n"]
     for result in results:
-        print(f"Paper: {result.title}")
-        print(f"Abstract: {result.abstract}")
-        print(f"Score: {result.score}")
-        print("---------------------")
+        buf.append(
+            f"Paper: {result.title}\n"
+            f"Abstract: {result.abstract}\n"
+            f"Score: {result.score}\n"
+            "---------------------\n"
+        )
+    sys.stdout.write("".join(buf))
 
 def interactive_search() -> None:
     """
@@ -180,17 +480,38 @@ def interactive_search() -> None:
     
     try:
         query = input("Insert your query: ")
-        results = engine.search(query)
+        results, correction = engine.search_with_correction(query)
         
-        if not results:
-            correction = engine.suggest_correction(query)
-            if correction:
-                print(f"\nMaybe did you mean: {correction} ?")
+        if correction:
+            print(f"\nMaybe did you mean: {correction} ?")
         
         format_results(results)
         
     except Exception as e:
         logger.error(f"Search session error: {str(e)}")
+    finally:
+        engine.close()
+
+def get_engine(warm_cache: bool = False,
+               warmup_queries: Optional[List[str]] = None) -> WhooshSearchEngine:
+    """
+    Shared search engine, opened on first use and refreshed on later calls
+    
+    Args:
+        warm_cache: Read the index files into the OS page cache when opening
+        warmup_queries: Queries to run into the result cache when opening
+        
+    Returns:
+        The shared WhooshSearchEngine
+    """
+    global _engine_singleton
+    with _engine_lock:
+        if _engine_singleton is None:
+            _engine_singleton = WhooshSearchEngine(warm_cache=warm_cache, warmup_queries=warmup_queries)
+            atexit.register(_engine_singleton.close)
+        else:
+            _engine_singleton.refresh()
+        return _engine_singleton
 
 def process_query(query: str, limit: int = 10) -> List[Dict]:
     """
@@ -204,17 +525,8 @@ def process_query(query: str, limit: int = 10) -> List[Dict]:
         List of dictionaries containing search results
     """
     try:
-        engine = WhooshSearchEngine()
-        results = engine.search(query, limit=limit)
-        
-        return [
-            {
-                "title": result.title,
-                "abstract": result.abstract,
-                "score": result.score
-            }
-            for result in results
-        ]
+        engine = get_engine()
+        return engine.search_dicts(query, limit=limit)
         
     except Exception as e:
         logger.error(f"Error processing query: {str(e)}")
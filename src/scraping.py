@@ -1,10 +1,13 @@
 import requests
 import os
-import re
 import logging
-from typing import Optional, List, Callable
+import tempfile
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import Optional, List, Callable, Set, Dict
 from dataclasses import dataclass
-from lxml import html
+from lxml import html, etree
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
 logging.basicConfig(
     level=logging.INFO,
@@ -12,6 +15,9 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+_TITLE_DELETE_TABLE = str.maketrans('', '', '\\/:"*?<>|')
+_CARD_PATH = "//div[contains(@class, 'card-container-11P0y')]"
+
 @dataclass
 class PaperMetadata:
     """
@@ -26,6 +32,16 @@ class CoreScraper:
     Scraper for core.ac.uk
     """
     
+    # Each expression walks the whole page once, hits are grouped by card afterwards
+    _CARD_XP = etree.XPath(_CARD_PATH)
+    _PDF_XPS = [
+        etree.XPath(_CARD_PATH + "//figure/a[.//span[contains(text(), 'Get PDF')]]/@href"),
+        etree.XPath(_CARD_PATH + "//a[contains(@class, 'download-pdf')]/@href"),
+        etree.XPath(_CARD_PATH + "//a[contains(@href, '/download/')]/@href")
+    ]
+    _TITLE_XP = etree.XPath(_CARD_PATH + "//h3[@itemprop='name']/a/span/text()")
+    _ABSTRACT_XP = etree.XPath(_CARD_PATH + "//div[@itemprop='abstract']/span/text()")
+    
     def __init__(self):
         self.base_url = 'https://core.ac.uk/search?q=fieldsOfStudy%3A%22computer+science%22&page='
         self.headers = {
@@ -33,6 +49,15 @@ class CoreScraper:
             'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8',
             'Accept-Language': 'en-US,en;q=0.5'
         }
+        self.session = requests.Session()
+        self.session.headers.update(self.headers)
+        adapter = HTTPAdapter(
+            pool_connections=16,
+            pool_maxsize=16,
+            max_retries=Retry(total=3, backoff_factor=0.3, status_forcelist=[429, 500, 502, 503, 504])
+        )
+        self.session.mount('https://', adapter)
+        self.session.mount('http://', adapter)
     
     def scrape_page(self, page_number: int) -> List[PaperMetadata]:
         """
@@ -40,58 +65,150 @@ class CoreScraper:
         """
         url = f"{self.base_url}{page_number}"
         try:
-            response = requests.get(url, headers=self.headers, timeout=30)
-            response.raise_for_status()
-            tree = html.fromstring(response.content)
+            parser = html.HTMLParser()
+            with self.session.get(url, stream=True, timeout=30) as response:
+                response.raise_for_status()
+                for chunk in response.iter_content(chunk_size=1 << 16):
+                    parser.feed(chunk)
+            tree = parser.close()
+            # The streaming parser returns no tree for a blank or comment-only body
+            if tree is None:
+                logger.error(f"Error fetching page {page_number}: Document is empty")
+                return []
+            
+            cards = self._CARD_XP(tree)
+            card_index = {card: i for i, card in enumerate(cards)}
+            
+            pdf_links: Dict[int, str] = {}
+            for pdf_xp in self._PDF_XPS:
+                if len(pdf_links) == len(cards):
+                    break
+                for i, link in self._first_per_card(pdf_xp(tree), card_index).items():
+                    pdf_links.setdefault(i, link)
+            titles = self._first_per_card(self._TITLE_XP(tree), card_index)
+            abstracts = self._first_per_card(self._ABSTRACT_XP(tree), card_index)
             
             results = []
-            for container in tree.xpath("//div[contains(@class, 'card-container-11P0y')]"):
-                try:
-                    pdf_link = None
-                    for pattern in [
-                        ".//figure/a[.//span[contains(text(), 'Get PDF')]]/@href",
-                        ".//a[contains(@class, 'download-pdf')]/@href",
-                        ".//a[contains(@href, '/download/')]/@href"
-                    ]:
-                        links = container.xpath(pattern)
-                        if links:
-                            pdf_link = links[0]
-                            break
-                    
-                    if not pdf_link:
-                        continue
-                    
-                    title = container.xpath(".//h3[@itemprop='name']/a/span/text()")
-                    abstract = container.xpath(".//div[@itemprop='abstract']/span/text()")
-                    
-                    if title:
-                        results.append(PaperMetadata(
-                            title=title[0],
-                            abstract=abstract[0] if abstract else "",
-                            pdf_url=pdf_link
-                        ))
-                except Exception as e:
-                    logger.error(f"Error extracting metadata: {str(e)}")
+            for i in range(len(cards)):
+                pdf_link = pdf_links.get(i)
+                if not pdf_link or i not in titles:
                     continue
+                
+                results.append(PaperMetadata(
+                    title=titles[i],
+                    abstract=abstracts.get(i, ""),
+                    pdf_url=pdf_link
+                ))
             
             return results
             
-        except Exception as e:
+        except (requests.RequestException, etree.XMLSyntaxError, etree.ParserError) as e:
             logger.error(f"Error fetching page {page_number}: {str(e)}")
             return []
     
-    def download_document(self, metadata: PaperMetadata) -> Optional[bytes]:
+    @staticmethod
+    def _first_per_card(values: list, card_index: Dict[etree._Element, int]) -> Dict[int, str]:
+        """
+        Map each card to the first value found inside it, in document order
+        """
+        first: Dict[int, str] = {}
+        for value in values:
+            for ancestor in value.getparent().iterancestors():
+                i = card_index.get(ancestor)
+                if i is not None:
+                    first.setdefault(i, value)
+                    break
+        return first
+    
+    def download_document(self, metadata: PaperMetadata, dst_path: str) -> bool:
+        """
+        Stream a paper's PDF to dst_path through a temporary file of its own, so
+        a failed download never leaves a truncated PDF behind or touches dst_path
+        """
+        tmp_path = None
         try:
-            response = requests.get(metadata.pdf_url, headers=self.headers, timeout=30)
-            response.raise_for_status()
-            return response.content
-        except Exception as e:
+            with self.session.get(metadata.pdf_url, stream=True, timeout=30) as response:
+                response.raise_for_status()
+                tmp_path = _mkstemp_beside(dst_path, '.part')
+                with open(tmp_path, 'wb') as f:
+                    for chunk in response.iter_content(chunk_size=1 << 16):
+                        f.write(chunk)
+            os.replace(tmp_path, dst_path)
+            return True
+        except (requests.RequestException, OSError) as e:
             logger.error(f"Error downloading {metadata.title}: {str(e)}")
-            return None
+            if tmp_path is not None:
+                _remove_quietly(tmp_path)
+            return False
+
+def _mkstemp_beside(path: str, suffix: str) -> str:
+    """
+    Create an empty temporary file, unique to the caller, next to path
+    """
+    fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(path) or '.', suffix=suffix)
+    os.close(fd)
+    # mkstemp creates files as 0600, give the final file the usual permissions
+    os.chmod(tmp_path, 0o644)
+    return tmp_path
+
+def _remove_quietly(path: str) -> None:
+    """
+    Remove a temporary file, ignoring one that is already gone
+    """
+    try:
+        os.remove(path)
+    except FileNotFoundError:
+        pass
+
+def _write_atomic(path: str, data: bytes) -> None:
+    """
+    Write data to path via a temporary file of its own and an atomic rename
+    """
+    tmp_path = _mkstemp_beside(path, '.tmp')
+    try:
+        fd = os.open(tmp_path, os.O_WRONLY)
+        try:
+            view = memoryview(data)
+            while view:
+                view = view[os.write(fd, view):]
+        finally:
+            os.close(fd)
+        os.replace(tmp_path, path)
+    except OSError:
+        _remove_quietly(tmp_path)
+        raise
 
-def scrape_papers(limit: int = 100, progress_callback: Optional[Callable[[int], None]] = None) -> None:
+def _fsync_dir(path: str) -> None:
     """
-    Scrape papers from CORE
+    Persist the directory entries created by the renames of a page batch
+    """
+    # Directories cannot be opened on Windows, where renames need no directory fsync
+    if os.name == 'nt':
+        return
+    fd = os.open(path, os.O_RDONLY)
+    try:
+        os.fsync(fd)
+    finally:
+        os.close(fd)
+
+def _collect_paper(scraper: CoreScraper, paper: PaperMetadata, pdf_path: str, abstract_path: str) -> bool:
+    """
+    Download a paper and save its abstract, runs on the download pool
+    """
+    if not scraper.download_document(paper, pdf_path):
+        return False
+    try:
+        _write_atomic(abstract_path, (paper.abstract or "*** Abstract not present ***").encode('utf-8'))
+        return True
+    except OSError as e:
+        logger.error(f"Error saving {paper.title}: {str(e)}")
+        return False
+
+def scrape_papers(limit: int = 100, 
+                  progress_callback: Optional[Callable[[int], None]] = None,
+                  max_workers: int = 8) -> None:
+    """
+    Scrape papers from CORE, downloading the PDFs of each page concurrently
     """
     try:
         scraper = CoreScraper()
@@ -103,40 +220,50 @@ def scrape_papers(limit: int = 100, progress_callback: Optional[Callable[[int],
         
         collected_count = 0
         current_page = 1
+        seen_urls: Set[str] = set()
+        seen_paths: Set[str] = set()
         
-        while collected_count < limit:
-            papers = scraper.scrape_page(current_page)
-            if not papers:
-                current_page += 1
-                continue
+        with scraper.session, ThreadPoolExecutor(max_workers=max_workers) as executor:
+            while collected_count < limit:
+                papers = scraper.scrape_page(current_page)
+                if not papers:
+                    current_page += 1
+                    continue
                 
-            for paper in papers:
-                if collected_count >= limit:
-                    break
+                # Only download as many papers as are still missing, skipping
+                # PDFs already seen on earlier (possibly repeated) pages
+                futures = {}
+                for paper in papers:
+                    if len(futures) >= limit - collected_count:
+                        break
+                    if paper.pdf_url in seen_urls:
+                        continue
+                    seen_urls.add(paper.pdf_url)
                     
-                if content := scraper.download_document(paper):
-                    try:
-                        sanitized_title = re.sub(r'[\\/:"*?<>|]+', '', paper.title)
-                        pdf_path = os.path.join(pdf_folder, f"{sanitized_title}.pdf")
-                        with open(pdf_path, 'wb') as f:
-                            f.write(content)
-                        
-                        abstract_path = os.path.join(txt_folder, f"{sanitized_title}.txt")
-                        with open(abstract_path, 'w', encoding='utf-8') as f:
-                            f.write(paper.abstract or "*** Abstract not present ***")
-                        
+                    # Titles that sanitize to the same name would race for the same files
+                    sanitized_title = paper.title.translate(_TITLE_DELETE_TABLE)
+                    pdf_path = os.path.join(pdf_folder, f"{sanitized_title}.pdf")
+                    if os.path.normcase(pdf_path) in seen_paths:
+                        logger.info(f"Skipping {paper.title}: another paper is saved as {pdf_path}")
+                        continue
+                    seen_paths.add(os.path.normcase(pdf_path))
+                    abstract_path = os.path.join(txt_folder, f"{sanitized_title}.txt")
+                    future = executor.submit(_collect_paper, scraper, paper, pdf_path, abstract_path)
+                    futures[future] = paper
+                
+                for future in as_completed(futures):
+                    paper = futures[future]
+                    if future.result():
                         collected_count += 1
                         logger.info(f"Collected paper {collected_count}/{limit}: {paper.title}")
                         
                         if progress_callback:
                             progress = int((collected_count / limit) * 100)
                             progress_callback(progress)
-                        
-                    except Exception as e:
-                        logger.error(f"Error saving {paper.title}: {str(e)}")
-                        continue
-            
-            current_page += 1
+                
+                _fsync_dir(pdf_folder)
+                _fsync_dir(txt_folder)
+                current_page += 1
         
         logger.info(f"Successfully collected {collected_count} documents")
         